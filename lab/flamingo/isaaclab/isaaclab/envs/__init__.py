@@ -1,2 +1,3 @@
 from .manager_based_constraint_rl_env import ManagerBasedConstraintRLEnv
-from .manager_based_constraint_rl_env_cfg import ManagerBasedConstraintRLEnvCfg
\ No newline at end of file
+from .manager_based_constraint_rl_env_cfg import ManagerBasedConstraintRLEnvCfg
+from .manager_based_buffered_rl_env import ManagerBasedBufferedRLEnv
@@ -0,0 +1,39 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from isaaclab.envs import ManagerBasedRLEnv
+
+from lab.flamingo.isaaclab.isaaclab.managers import BufferedObservationGroupCfg, BufferedObservationManager
+
+
+class ManagerBasedBufferedRLEnv(ManagerBasedRLEnv):
+    """Manager-based RL environment computing the observations with the :class:`BufferedObservationManager`.
+
+    This environment behaves as the :class:`ManagerBasedRLEnv`, but the observation groups configured with
+    :class:`~lab.flamingo.isaaclab.isaaclab.managers.BufferedObservationGroupCfg` can write their observations
+    into preallocated buffers.
+    """
+
+    def load_managers(self):
+        # note: the ObservationManager created by the parent classes takes the settings of the buffered groups
+        #   as observation terms and fails on them. They are thus removed from the configuration while the
+        #   parent classes create the managers, and restored for the BufferedObservationManager afterwards.
+        group_settings = dict()
+        for group_name, group_cfg in self.cfg.observations.__dict__.items():
+            if isinstance(group_cfg, BufferedObservationGroupCfg) and "preallocated" in group_cfg.__dict__:
+                group_settings[group_name] = group_cfg.__dict__.pop("preallocated")
+        try:
+            super().load_managers()
+        finally:
+            for group_name, preallocated in group_settings.items():
+                self.cfg.observations.__dict__[group_name].preallocated = preallocated
+
+        # -- observation manager
+        # note: the buffered manager computes the same terms with the same dimensions as the one it replaces,
+        #   so the observation spaces configured by the parent classes remain valid
+        self.observation_manager = BufferedObservationManager(self.cfg.observations, self)
+        print("[INFO] Buffered Observation Manager:", self.observation_manager)
@@ -0,0 +1,8 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Sub-module with the MDP terms shared by the environments of the tasks."""
+
+from .observations import *  # noqa: F401, F403
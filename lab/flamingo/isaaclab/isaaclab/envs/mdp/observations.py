@@ -0,0 +1,71 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Observation terms shared by the observation modules of the tasks."""
+
+from __future__ import annotations
+
+import math
+import torch
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedRLEnv
+
+
+def generated_scaled_commands(env: ManagerBasedRLEnv, command_name: str, scale: tuple | float) -> torch.Tensor:
+    """The generated command from command term in the command manager with the given name.
+
+    The first three components of the command are multiplied by the given scale, which is either one value
+    per component or a single value for all of them.
+    """
+    # convert the scale into a device tensor once per environment
+    scales = env.__dict__.setdefault("_command_scales", dict())
+    key = tuple(scale) if isinstance(scale, (tuple, list)) else (scale,)
+    scale_t = scales.get(key)
+    if scale_t is None:
+        scale_t = torch.tensor(key, dtype=torch.float, device=env.device).reshape(1, -1)
+        scales[key] = scale_t
+    command = env.command_manager.get_command(command_name)
+    return torch.cat([command[:, :3] * scale_t, command[:, 3:]], dim=-1)
+
+
+def _stack_lift_masks(
+    env: ManagerBasedRLEnv, key: tuple[str, str], left_mask: torch.Tensor, right_mask: torch.Tensor
+) -> torch.Tensor:
+    """Left and right lift masks stacked along the second dimension into a buffer stored on the env.
+
+    The buffer is allocated on the first call for the given key (the names of the left and right sensors) and
+    is overwritten on every call, since the observation manager copies the output of the terms.
+    """
+    lift_mask_bufs = env.__dict__.setdefault("_lift_mask_buf", dict())
+    lift_mask = lift_mask_bufs.get(key)
+    if lift_mask is None:
+        lift_mask = torch.empty(
+            (left_mask.shape[0], 2, *left_mask.shape[1:]), dtype=left_mask.dtype, device=left_mask.device
+        )
+        lift_mask_bufs[key] = lift_mask
+    return torch.stack([left_mask, right_mask], dim=1, out=lift_mask)
+
+
+def _zero_reward(env: ManagerBasedRLEnv) -> torch.Tensor:
+    """Zero rewards of shape (num_envs, 1), allocated once and stored on the env.
+
+    The buffer is never written: the observation manager copies the output of the terms.
+    """
+    zero_reward = env.__dict__.get("_zero_reward_buf")
+    if zero_reward is None:
+        zero_reward = torch.zeros((env.num_envs, 1), dtype=torch.float32, device=env.device)
+        env._zero_reward_buf = zero_reward
+    return zero_reward
+
+
+def _wrap(angles: torch.Tensor) -> torch.Tensor:
+    """Wraps the angles to [-pi, pi] by subtracting the nearest multiple of 2*pi.
+
+    Same as :func:`isaaclab.utils.math.wrap_to_pi` for the angles in [0, 2*pi] returned by
+    :func:`isaaclab.utils.math.euler_xyz_from_quat`, but with a rounding instead of a floating-point modulo.
+    """
+    return angles - (2 * math.pi) * torch.round(angles * (0.5 / math.pi))
@@ -1,2 +1,4 @@
 from .constraint_term_cfg import ConstraintTermCfg
 from .constraint_manager import ConstraintManager
+from .buffered_observation_cfg import BufferedObservationGroupCfg
+from .buffered_observation_manager import BufferedObservationManager
@@ -0,0 +1,25 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+from __future__ import annotations
+
+from isaaclab.utils import configclass
+from isaaclab.managers.manager_term_cfg import ObservationGroupCfg
+
+
+@configclass
+class BufferedObservationGroupCfg(ObservationGroupCfg):
+    """Configuration for an observation group handled by the :class:`BufferedObservationManager`."""
+
+    preallocated: bool = False
+    """Whether to write the concatenated observations of the group into a preallocated buffer. Defaults to False.
+
+    If True, the buffer is allocated once when the manager is created and the observation terms are copied
+    into their slices of it on every computation, instead of concatenating them into a new tensor. The
+    returned tensor is then the same buffer for every call and is overwritten by the next computation.
+
+    Note:
+        This only applies to groups with :attr:`concatenate_terms` set to True and terms of shape (num_envs, dim).
+    """
@@ -0,0 +1,174 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Observation manager writing the concatenated observation groups into preallocated buffers."""
+
+from __future__ import annotations
+
+import functools
+import torch
+from collections.abc import Callable
+from typing import TYPE_CHECKING
+
+from isaaclab.managers import ManagerTermBase, ObservationManager, ObservationTermCfg
+from .buffered_observation_cfg import BufferedObservationGroupCfg
+
+if TYPE_CHECKING:
+    from isaaclab.envs import ManagerBasedEnv
+
+
+class BufferedObservationManager(ObservationManager):
+    """Observation manager with preallocated buffers for the concatenated observation groups.
+
+    For the groups configured with :class:`BufferedObservationGroupCfg` and ``preallocated=True``, the output
+    buffer and the slice of every term inside it are computed once when the manager is created. Every
+    computation then copies the processed observation terms into their slices, instead of allocating a new
+    tensor with :func:`torch.cat`. The other groups are computed as in the :class:`ObservationManager`.
+
+    Additionally, the function terms that appear with the same function and parameters in several groups (e.g.
+    the same joint positions for the policy and the critic) are only evaluated once per :meth:`compute`. The
+    post-processing (noise, clipping and scaling) is still applied per group on a copy of the term.
+
+    Note:
+        The returned tensor is the same buffer for every computation of the group. Consumers that keep the
+        observations across steps have to clone them.
+    """
+
+    def __init__(self, cfg: object, env: ManagerBasedEnv):
+        """Initialize the observation manager.
+
+        Args:
+            cfg: The configuration object or dictionary (``dict[str, ObservationGroupCfg]``).
+            env: The environment instance.
+
+        Raises:
+            ValueError: If a preallocated group is not concatenated or has terms that are not of
+                shape (num_envs, dim).
+        """
+        super().__init__(cfg, env)  # _prepare_terms() called here
+
+        # allocate the output buffers and the term slices of the preallocated groups
+        self._group_obs_out: dict[str, torch.Tensor] = dict()
+        self._group_obs_term_slices: dict[str, list[tuple[int, int]]] = dict()
+        for group_name, preallocated in self._group_obs_preallocated.items():
+            if not preallocated:
+                continue
+            group_term_dims = self._group_obs_term_dim[group_name]
+            if not self._group_obs_concatenate[group_name] or any(len(dims) != 1 for dims in group_term_dims):
+                raise ValueError(
+                    f"Unable to preallocate the observation group '{group_name}'. Preallocated groups must"
+                    f" concatenate terms of shape (num_envs, dim). The shapes of the terms are: {group_term_dims}."
+                )
+            term_slices = list()
+            start = 0
+            for dims in group_term_dims:
+                term_slices.append((start, start + dims[0]))
+                start += dims[0]
+            self._group_obs_term_slices[group_name] = term_slices
+            self._group_obs_out[group_name] = torch.zeros((self.num_envs, start), device=self.device)
+
+        # share the evaluation of the terms that appear in several groups
+        self._term_cache: dict[int, torch.Tensor] | None = None
+        # note: the terms are identified by their original function and parameters
+        unique_terms: list[tuple[Callable[..., torch.Tensor], dict, list[ObservationTermCfg]]] = list()
+        for group_term_cfgs in self._group_obs_term_cfgs.values():
+            for term_cfg in group_term_cfgs:
+                # class terms are skipped since the manager calls their reset through the term function
+                if isinstance(term_cfg.func, ManagerTermBase):
+                    continue
+                for func, params, term_cfgs in unique_terms:
+                    if term_cfg.func is func and term_cfg.params == params:
+                        term_cfgs.append(term_cfg)
+                        break
+                else:
+                    unique_terms.append((term_cfg.func, term_cfg.params, [term_cfg]))
+        for index, (func, _, term_cfgs) in enumerate(unique_terms):
+            if len(term_cfgs) > 1:
+                cached_func = self._cached_term_func(index, func)
+                for term_cfg in term_cfgs:
+                    term_cfg.func = cached_func
+
+    """
+    Operations.
+    """
+
+    def compute(self, **kwargs) -> dict[str, torch.Tensor | dict[str, torch.Tensor]]:
+        """Compute the observations per group for all groups.
+
+        Please check :meth:`ObservationManager.compute`. The terms shared between groups are evaluated once.
+
+        Args:
+            **kwargs: The keyword arguments forwarded to :meth:`ObservationManager.compute`.
+
+        Returns:
+            A dictionary with keys as the group names and values as the computed observations.
+        """
+        self._term_cache = dict()
+        try:
+            return super().compute(**kwargs)
+        finally:
+            self._term_cache = None
+
+    def compute_group(self, group_name: str, **kwargs) -> torch.Tensor | dict[str, torch.Tensor]:
+        """Computes the observations for a given group.
+
+        Please check :meth:`ObservationManager.compute_group` for the computation of the observation terms.
+        For preallocated groups, the terms are copied into the preallocated buffer of the group, which is returned.
+
+        Args:
+            group_name: The name of the group for which to compute the observations.
+            **kwargs: The keyword arguments forwarded to :meth:`ObservationManager.compute_group`.
+
+        Returns:
+            The observations of the group.
+        """
+        group_obs_out = self._group_obs_out.get(group_name)
+        if group_obs_out is None:
+            return super().compute_group(group_name, **kwargs)
+
+        # compute the processed terms of the group without concatenating them
+        self._group_obs_concatenate[group_name] = False
+        try:
+            group_obs = super().compute_group(group_name, **kwargs)
+        finally:
+            self._group_obs_concatenate[group_name] = True
+        # write the terms into their slices of the buffer
+        for (start, end), obs in zip(self._group_obs_term_slices[group_name], group_obs.values()):
+            group_obs_out[:, start:end].copy_(obs)
+        return group_obs_out
+
+    """
+    Helper functions.
+    """
+
+    def _prepare_terms(self):
+        """Prepares a list of observation terms functions."""
+        # read the settings of the buffered groups
+        # note: the settings are removed from the (copied) group configurations since the observation manager
+        #   expects all the non-default settings of a group to be observation terms
+        self._group_obs_preallocated: dict[str, bool] = dict()
+        if isinstance(self.cfg, dict):
+            group_cfg_items = self.cfg.items()
+        else:
+            group_cfg_items = self.cfg.__dict__.items()
+        for group_name, group_cfg in group_cfg_items:
+            if isinstance(group_cfg, BufferedObservationGroupCfg):
+                self._group_obs_preallocated[group_name] = group_cfg.__dict__.pop("preallocated")
+
+        super()._prepare_terms()
+
+    def _cached_term_func(self, index: int, func: Callable[..., torch.Tensor]) -> Callable[..., torch.Tensor]:
+        """Wraps a shared term function to evaluate it once per :meth:`compute`."""
+
+        @functools.wraps(func)
+        def cached_func(env, **params) -> torch.Tensor:
+            # outside of compute (e.g. compute_group called directly), the term is always evaluated
+            if self._term_cache is None:
+                return func(env, **params)
+            if index not in self._term_cache:
+                self._term_cache[index] = func(env, **params)
+            return self._term_cache[index]
+
+        return cached_func
@@ -0,0 +1,92 @@
+# Copyright (c) 2022-2025, The Isaac Lab Project Developers.
+# All rights reserved.
+#
+# SPDX-License-Identifier: BSD-3-Clause
+
+"""Launch Isaac Sim Simulator first."""
+
+from isaaclab.app import AppLauncher
+
+# launch omniverse app
+simulation_app = AppLauncher(headless=True).app
+
+"""Rest everything follows."""
+
+import pytest
+import torch
+
+from isaaclab.managers import ObservationManager
+
+from lab.flamingo.isaaclab.isaaclab.envs import ManagerBasedBufferedRLEnv
+from lab.flamingo.isaaclab.isaaclab.managers import BufferedObservationGroupCfg, BufferedObservationManager
+from lab.flamingo.tasks.manager_based.locomotion.position.flamingo_env.rough_env.stair.stair_env_cfg import (
+    FlamingoRoughEnvCfg_PLAY,
+)
+
+
+@pytest.fixture(scope="module")
+def env():
+    """The rough position environment, built from its registered configuration with a few environments."""
+    env_cfg = FlamingoRoughEnvCfg_PLAY()
+    env_cfg.scene.num_envs = 2
+    if env_cfg.scene.terrain.terrain_generator is not None:
+        env_cfg.scene.terrain.terrain_generator.num_rows = 2
+        env_cfg.scene.terrain.terrain_generator.num_cols = 2
+    env = ManagerBasedBufferedRLEnv(cfg=env_cfg)
+    yield env
+    env.close()
+
+
+def test_observation_manager_type(env):
+    """The observation manager of the environment is the buffered manager."""
+    assert type(env.observation_manager) is BufferedObservationManager
+    # the settings of the buffered groups are not taken as observation terms
+    for group_name, term_names in env.observation_manager.active_terms.items():
+        assert "preallocated" not in term_names, group_name
+    # the settings are restored on the configuration after the managers are created
+    assert any(
+        getattr(cfg, "preallocated", False)
+        for cfg in env.cfg.observations.__dict__.values()
+        if isinstance(cfg, BufferedObservationGroupCfg)
+    )
+
+
+def test_preallocated_groups(env):
+    """The preallocated groups of the rough configuration are written into their buffers."""
+    group_cfgs = {
+        name: cfg for name, cfg in env.cfg.observations.__dict__.items() if isinstance(cfg, BufferedObservationGroupCfg)
+    }
+    assert len(group_cfgs) > 0
+
+    obs = env.observation_manager.compute()
+    obs_next = env.observation_manager.compute()
+    for group_name, group_cfg in group_cfgs.items():
+        if not group_cfg.preallocated:
+            continue
+        group_obs = obs[group_name]
+        assert group_obs.shape == (env.num_envs, *env.observation_manager.group_obs_dim[group_name])
+        # the buffers keep the precision of the terms, the actor casts its input under autocast
+        assert group_obs.dtype == torch.float32
+        assert torch.isfinite(group_obs).all()
+        # the same buffer is returned by every computation
+        assert obs_next[group_name].data_ptr() == group_obs.data_ptr()
+
+
+def test_matches_concatenation(env):
+    """The preallocated buffers hold the concatenation of the terms."""
+    manager = env.observation_manager
+    for group_name in manager._group_obs_out:
+        # compute the terms without the buffer
+        # note: the noise is disabled so that both computations return the same values
+        corruption = manager._group_obs_enable_corruption[group_name]
+        manager._group_obs_enable_corruption[group_name] = False
+        manager._group_obs_concatenate[group_name] = False
+        try:
+            expected = torch.cat(list(ObservationManager.compute_group(manager, group_name).values()), dim=-1)
+        finally:
+            manager._group_obs_concatenate[group_name] = True
+        try:
+            group_obs = manager.compute_group(group_name)
+        finally:
+            manager._group_obs_enable_corruption[group_name] = corruption
+        torch.testing.assert_close(group_obs, expected)
@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import torch
-import math
 from typing import TYPE_CHECKING
 
 import isaaclab.utils.math as math_utils
@@ -18,6 +17,8 @@ from isaaclab.utils.math import euler_xyz_from_quat
 from isaaclab.sensors import ContactSensor
 from isaaclab.markers import VisualizationMarkers
 
+from lab.flamingo.isaaclab.isaaclab.envs.mdp.observations import _stack_lift_masks, _wrap, _zero_reward
+
 
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
@@ -53,29 +54,23 @@ def base_pos_z_rel_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneE
         return asset.data.root_link_pos_w[:, 2].unsqueeze(-1) - sensor.data.ray_hits_w[..., 2]
     else:
         return asset.data.root_link_pos_w[:, 2].unsqueeze(-1)
-    
-def base_pos_z_rel(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"), sensor_cfg: SceneEntityCfg | None = None) -> torch.Tensor:
-    """Root height in the simulation world frame."""
-    # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    if sensor_cfg is not None:
-        sensor: RayCaster = env.scene[sensor_cfg.name]
-        return asset.data.root_link_pos_w[:, 2].unsqueeze(-1) - sensor.data.ray_hits_w[..., 2]
-    else:
-        return asset.data.root_link_pos_w[:, 2].unsqueeze(-1)
+
+
+# both terms read the root link position, thus they share the same implementation
+base_pos_z_rel = base_pos_z_rel_link
 
 
 def current_reward(env: ManagerBasedRLEnv) -> torch.Tensor:
     """The current reward value. Returns zeros if the reward manager is not initialized."""
     if not hasattr(env, "reward_manager") or env.reward_manager is None:
         # Assuming the shape should be (num_envs,) based on the environment
-        return torch.zeros((env.num_envs, 1), dtype=torch.float32, device=env.device)
+        return _zero_reward(env)
 
     try:
         return env.reward_buf.unsqueeze(-1)
     except AttributeError:
         # Fallback to zeros if the reward_manager is initialized but compute isn't ready
-        return torch.zeros((env.num_envs, 1), dtype=torch.float32, device=env.device)
+        return _zero_reward(env)
 
 
 def joint_torques(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
@@ -88,8 +83,10 @@ def is_contact(env: ManagerBasedRLEnv, threshold: float, sensor_cfg: SceneEntity
     # extract the used quantities (to enable type-hinting)
     contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
     # check if contact force is above threshold
+    # note: the squared norms are compared against the squared threshold to avoid the square root
     net_contact_forces = contact_sensor.data.net_forces_w_history
-    is_contact = torch.max(torch.norm(net_contact_forces[:, :, sensor_cfg.body_ids], dim=-1), dim=1)[0] > threshold
+    force_sq = net_contact_forces[:, :, sensor_cfg.body_ids].square().sum(dim=-1)
+    is_contact = force_sq.amax(dim=1) > threshold * threshold
     return is_contact.float()
 
 
@@ -120,7 +117,8 @@ def lift_mask_by_height_scan(
     left_mask= left_lift_mask_sensor.data.mask 
     right_mask = right_lift_mask_sensor.data.mask  
     
-    lift_mask = torch.stack([left_mask, right_mask], dim=1) 
+    # stack the masks into a buffer owned by the env
+    lift_mask = _stack_lift_masks(env, (sensor_cfg_left.name, sensor_cfg_right.name), left_mask, right_mask)
 
     command_norm = torch.norm(env.command_manager.get_command(command_name)[:, :3], dim=1)  # Shape: [num_envs]
     lift_mask *= (command_norm > 0.1).unsqueeze(-1).float()  # Apply movement condition
@@ -143,12 +141,8 @@ def base_euler_angle(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEnti
     asset = env.scene[asset_cfg.name]
     roll, pitch, yaw = euler_xyz_from_quat(asset.data.root_com_quat_w)
 
-    # Map angles from [0, 2*pi] to [-pi, pi]
-    roll = (roll + math.pi) % (2 * math.pi) - math.pi
-    pitch = (pitch + math.pi) % (2 * math.pi) - math.pi
-    yaw = (yaw + math.pi) % (2 * math.pi) - math.pi
-
-    rpy = torch.stack((roll, pitch, yaw), dim=-1)
+    # Map angles from [0, 2*pi] to [-pi, pi] (in one pass over the stacked angles)
+    rpy = _wrap(torch.stack((roll, pitch, yaw), dim=-1))
     return rpy
 
 def base_euler_angle_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
@@ -157,12 +151,8 @@ def base_euler_angle_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = Scen
     asset = env.scene[asset_cfg.name]
     roll, pitch, yaw = euler_xyz_from_quat(asset.data.root_link_quat_w)
 
-    # Map angles from [0, 2*pi] to [-pi, pi]
-    roll = (roll + math.pi) % (2 * math.pi) - math.pi
-    pitch = (pitch + math.pi) % (2 * math.pi) - math.pi
-    yaw = (yaw + math.pi) % (2 * math.pi) - math.pi
-
-    rpy = torch.stack((roll, pitch, yaw), dim=-1)
+    # Map angles from [0, 2*pi] to [-pi, pi] (in one pass over the stacked angles)
+    rpy = _wrap(torch.stack((roll, pitch, yaw), dim=-1))
     return rpy
 
 
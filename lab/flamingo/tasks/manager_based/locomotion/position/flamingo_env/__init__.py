@@ -41,7 +41,7 @@ gym.register(
 
 gym.register(
     id="Isaac-Position-Rough-Flamingo-v1-ppo",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="lab.flamingo.isaaclab.isaaclab.envs:ManagerBasedBufferedRLEnv",
     disable_env_checker=True,
     kwargs={
         "env_cfg_entry_point": rough_env.stair_env_cfg.FlamingoRoughEnvCfg,
@@ -51,7 +51,7 @@ gym.register(
 
 gym.register(
     id="Isaac-Position-Rough-Flamingo-v1-ppo-Play",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
+    entry_point="lab.flamingo.isaaclab.isaaclab.envs:ManagerBasedBufferedRLEnv",
     disable_env_checker=True,
     kwargs={
         "env_cfg_entry_point": rough_env.stair_env_cfg.FlamingoRoughEnvCfg_PLAY,
@@ -64,6 +64,8 @@ class FlamingoRoughPPORunnerCfg_Position(FlamingoPPORunnerCfg):
         self.experiment_name = "Flamingo_Rough_Position"
         self.policy.actor_hidden_dims = [512, 256, 128]
         self.policy.critic_hidden_dims = [512, 256, 128]
+        self.policy.policy_dtype = "bfloat16"
+        self.policy.compile_policy = True
 
 ###############################################################################################
 ######################################## [ SRMPPO CONFIG] ######################################
@@ -13,7 +13,6 @@ from isaaclab.assets import ArticulationCfg, AssetBaseCfg
 from isaaclab.envs import ManagerBasedRLEnvCfg
 from isaaclab.managers import CurriculumTermCfg as CurrTerm
 from isaaclab.managers import EventTermCfg as EventTerm
-from isaaclab.managers import ObservationGroupCfg as ObsGroup
 from isaaclab.managers import ObservationTermCfg as ObsTerm
 from isaaclab.managers import RewardTermCfg as RewTerm
 from isaaclab.managers import SceneEntityCfg
@@ -28,6 +27,7 @@ from isaaclab.utils.noise import GaussianNoiseCfg as Gnoise
 import lab.flamingo.tasks.manager_based.locomotion.position.mdp as mdp
 import lab.flamingo.tasks.manager_based.locomotion.position.mdp.commands as cmd
 
+from lab.flamingo.isaaclab.isaaclab.managers import BufferedObservationGroupCfg as ObsGroup
 from lab.flamingo.tasks.manager_based.locomotion.position.sensors import LiftMaskCfg
 
 ##
@@ -161,13 +161,12 @@ class ObservationsCfg:
         base_projected_gravity = ObsTerm(func=mdp.projected_gravity)  # default: -0.05
         actions = ObsTerm(func=mdp.last_action)
         # estimation 
-        base_lin_vel_x = ObsTerm(func=mdp.base_lin_vel_x_link)
-        base_lin_vel_y = ObsTerm(func=mdp.base_lin_vel_y_link)
-        base_lin_vel_z = ObsTerm(func=mdp.base_lin_vel_z_link)
+        base_lin_vel = ObsTerm(func=mdp.base_lin_vel_link)
 
         def __post_init__(self):
             self.enable_corruption = False
             self.concatenate_terms = True
+            self.preallocated = True
 
     @configclass
     class NoneStackCriticCfg(ObsGroup):
@@ -183,17 +182,15 @@ class ObservationsCfg:
             
         )
 
-        contact_forces = ObsTerm(
-            func=mdp.measure_contact_forces,
-            params={ "sensor_cfg": SceneEntityCfg("contact_forces", body_names=[".*_wheel_link"])})
-        
-        feet_air_time = ObsTerm(
-            func=mdp.measure_feet_air_time,
-            params={ "sensor_cfg": SceneEntityCfg("contact_forces", body_names=[".*_wheel_link"])})   
+        # contact forces (6) and air time (2) of the wheels
+        wheel_contact = ObsTerm(
+            func=mdp.wheel_contact_features,
+            params={"sensor_cfg": SceneEntityCfg("contact_forces", body_names=[".*_wheel_link"])})
 
         def __post_init__(self):
             self.enable_corruption = False
             self.concatenate_terms = True
+            self.preallocated = True
 
     @configclass
     class StackPolicyCfg(ObsGroup):
@@ -214,13 +211,12 @@ class ObservationsCfg:
         actions = ObsTerm(func=mdp.last_action)
         
         # TODO : 10 Hz 로 상태 update 구현.
-        base_lin_vel_x = ObsTerm(func=mdp.base_lin_vel_x_link, noise=Unoise(n_min=-0.05, n_max=0.05))
-        base_lin_vel_y = ObsTerm(func=mdp.base_lin_vel_y_link, noise=Unoise(n_min=-0.05, n_max=0.05))
-        base_lin_vel_z = ObsTerm(func=mdp.base_lin_vel_z_link, noise=Unoise(n_min=-0.05, n_max=0.05))
+        base_lin_vel = ObsTerm(func=mdp.base_lin_vel_link, noise=Unoise(n_min=-0.05, n_max=0.05))
  
         def __post_init__(self):
             self.enable_corruption = True
             self.concatenate_terms = True
+            self.preallocated = True
 
 
     @configclass
@@ -239,6 +235,7 @@ class ObservationsCfg:
         def __post_init__(self):
             self.enable_corruption = True
             self.concatenate_terms = True
+            self.preallocated = True
 
     # observation groups
     stack_policy: StackPolicyCfg = StackPolicyCfg()
@@ -253,10 +250,10 @@ class EventCfg:
 
     # startup
     physics_material = EventTerm(
-        func=mdp.randomize_rigid_body_material,
+        func=mdp.randomize_rigid_body_material_fast,
         mode="startup",
         params={
-            "asset_cfg": SceneEntityCfg("robot", body_names=".*"),
+            "asset_cfg": SceneEntityCfg("robot"),
             "static_friction_range": (0.8, 1.0),
             "dynamic_friction_range": (0.6, 0.8),
             "restitution_range": (0.0, 0.0),
@@ -264,37 +261,28 @@ class EventCfg:
         },
     )
 
-    randomize_joint_actuator_gains = EventTerm(
-        func=mdp.randomize_actuator_gains,
-        mode="startup",
-        params={
-            "asset_cfg": SceneEntityCfg("robot", joint_names=[".*hip_joint", ".*shoulder_joint"]),
-            "stiffness_distribution_params": (0.7, 1.3),
-            "damping_distribution_params": (0.7, 1.3),
-            "operation": "scale",
-            "distribution": "log_uniform",
-        },
-    )
-
-    randomize_leg_joint_actuator_gains = EventTerm(
-        func=mdp.randomize_actuator_gains,
-        mode="startup",
-        params={
-            "asset_cfg": SceneEntityCfg("robot", joint_names=".*leg_joint"),
-            "stiffness_distribution_params": (0.8, 1.3),
-            "damping_distribution_params": (0.8, 1.3),
-            "operation": "scale",
-            "distribution": "log_uniform",
-        },
-    )
-
-    randomize_wheel_actuator_gains = EventTerm(
-        func=mdp.randomize_actuator_gains,
+    randomize_actuator_gains = EventTerm(
+        func=mdp.randomize_actuator_gains_grouped,
         mode="startup",
         params={
-            "asset_cfg": SceneEntityCfg("robot", joint_names=".*wheel_joint"),
-            "stiffness_distribution_params": (0.7, 1.3),
-            "damping_distribution_params": (0.7, 1.3),
+            "asset_cfg": SceneEntityCfg("robot"),
+            "groups": [
+                {
+                    "joint_names": [".*hip_joint", ".*shoulder_joint"],
+                    "stiffness_distribution_params": (0.7, 1.3),
+                    "damping_distribution_params": (0.7, 1.3),
+                },
+                {
+                    "joint_names": [".*leg_joint"],
+                    "stiffness_distribution_params": (0.8, 1.3),
+                    "damping_distribution_params": (0.8, 1.3),
+                },
+                {
+                    "joint_names": [".*wheel_joint"],
+                    "stiffness_distribution_params": (0.7, 1.3),
+                    "damping_distribution_params": (0.7, 1.3),
+                },
+            ],
             "operation": "scale",
             "distribution": "log_uniform",
         },
@@ -321,7 +309,7 @@ class EventCfg:
     )
 
     reset_base = EventTerm(
-        func=mdp.reset_root_state_uniform,
+        func=mdp.reset_root_state_uniform_batched,
         mode="reset",
         params={
             "pose_range": {"x": (-0.5, 0.5), "y": (-0.5, 0.5), "yaw": (-3.14, 3.14)},
@@ -30,6 +30,29 @@ if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv
 
 
+@torch.jit.script
+def _step_event_command(
+    time_elapsed: torch.Tensor,
+    active: torch.Tensor,
+    reset_buf: torch.Tensor,
+    step_dt: torch.Tensor,
+    event_during_time: torch.Tensor,
+):
+    """Advance the event timers in-place.
+
+    All buffers are updated in-place so that no temporaries of shape (num_envs,) are allocated per step.
+    The reset environments are cleared with a masked write instead of gathering their indices.
+    The step time and the event duration are 0-d tensors on the device of the buffers.
+    """
+    # advance the timer of active events, clear the others
+    time_elapsed.add_(step_dt).mul_(active)
+    active.logical_and_(time_elapsed <= event_during_time)
+    # clear the reset environments
+    reset = reset_buf.bool()
+    time_elapsed.masked_fill_(reset, 0.0)
+    active.masked_fill_(reset, False)
+
+
 class EventCommand(CommandTerm):
     """Command generator that generates a event flag.
 
@@ -52,10 +75,22 @@ class EventCommand(CommandTerm):
         self.robot: Articulation = env.scene[cfg.asset_name]
         
         self.time_elapsed = torch.zeros(self.num_envs, device=self.device)
-        
-        self.event_command = torch.zeros(self.num_envs,2, dtype=torch.float32, device=self.device)
+        # whether the event of each environment is active
+        self._active = torch.zeros(self.num_envs, dtype=torch.bool, device=self.device)
+        # the command (active flag, elapsed time), only assembled when it is read
+        self._event_command = torch.zeros(self.num_envs, 2, dtype=torch.float32, device=self.device)
         
         self.event_during_time = cfg.event_during_time
+        # step time and event duration as device scalars for the update
+        self._step_dt_t = torch.tensor(float(self._env.step_dt), device=self.device)
+        self._dur_t = torch.tensor(float(self.event_during_time), device=self.device)
+        # episode time per step, as used by the resampling condition
+        self._dt_x4 = self.env.physics_dt * 4
+        # marker positions for the debug visualization, updated in-place
+        self._viz_pos = torch.zeros(self.num_envs, 3, device=self.device)
+        self._viz_scales = torch.ones(self.num_envs, 3, device=self.device)
+        # start at the last count so that the first callback draws the markers
+        self._viz_counter = self.cfg.debug_vis_decimation - 1
         
         
     def __str__(self) -> str:
@@ -66,8 +101,18 @@ class EventCommand(CommandTerm):
 
     @property
     def command(self) -> torch.Tensor:
-        """The event command. Shape is (num_envs)."""
+        """The event command. Shape is (num_envs, 2)."""
         return self.event_command
+
+    @property
+    def event_command(self) -> torch.Tensor:
+        """The event command: the active flag (0.0 or 1.0) and the elapsed time of the event. Shape is (num_envs, 2).
+
+        The returned buffer is updated in-place every time the property is read.
+        """
+        self._event_command[:, 0].copy_(self._active)
+        self._event_command[:, 1].copy_(self.time_elapsed)
+        return self._event_command
     
     def _update_metrics(self):
         # time for which the command was executed
@@ -78,16 +123,10 @@ class EventCommand(CommandTerm):
 
 
         #r = torch.zeros(len(env_ids), device=self.device)
-        # command of event
-        current_time = self.env.episode_length_buf * self.env.physics_dt * 4
-
-        self.event_command[env_ids, 0] = torch.where(
-                                                        current_time[env_ids] >= 2.0,
-                                                        torch.ones_like(self.event_command[env_ids, 0], dtype=torch.float32, device=self.device),
-                                                        torch.zeros_like(self.event_command[env_ids, 0], dtype=torch.float32, device=self.device)
-        )
-
-        self.time_elapsed[env_ids] = torch.zeros(len(env_ids), dtype=torch.float32, device=self.device)
+        # command of event: only environments that have been running for a while start the event
+        current_time = self.env.episode_length_buf[env_ids].float().mul_(self._dt_x4)
+        self._active[env_ids] = current_time >= 2.0
+        self.time_elapsed[env_ids] = 0.0
         #print('==============Resample===============')
         # print(env_ids)
         # randomly stand command
@@ -97,21 +136,18 @@ class EventCommand(CommandTerm):
         """
         Update the event command.
 
-        - When command is active (event_command[:, 0] == 1.0), increase time_elapsed by dt.
+        - When command is active, increase time_elapsed by dt.
         - If time_elapsed > event_during_time, deactivate the command and reset the timer.
         - If environment is reset, reset both the timer and command values.
         """
         
-        self.time_elapsed = torch.where(self.event_command[:,0]==1.0,
-                                        self.time_elapsed + self._env.step_dt,
-                                        0.0)
-        self.event_command[:, 0] = torch.logical_and(self.event_command[:,0]==1.0 , self.time_elapsed <= self.event_during_time).float()
-        self.event_command[:,1] = self.time_elapsed
-
-        reset_env_ids = self._env.reset_buf.nonzero(as_tuple=False).flatten()
-        if len(reset_env_ids) > 0:
-            self.time_elapsed[reset_env_ids] = 0.0
-            self.event_command[reset_env_ids] = 0.0
+        _step_event_command(
+            self.time_elapsed,
+            self._active,
+            self._env.reset_buf,
+            self._step_dt_t,
+            self._dur_t,
+        )
 
     def _set_debug_vis_impl(self, debug_vis: bool):
             if debug_vis:
@@ -132,19 +168,22 @@ class EventCommand(CommandTerm):
         if not self.robot.is_initialized:
             return
 
-        # Clone base positions and raise them slightly for visualization
-        base_pos_w = self.robot.data.root_pos_w.clone()
-        base_pos_w[:, 2] += 0.65
+        # only refresh the markers every few callbacks
+        self._viz_counter += 1
+        if self._viz_counter < self.cfg.debug_vis_decimation:
+            return
+        self._viz_counter = 0
 
-        # Get indices where event_command command is active
-        active_indices = (self.event_command[:, 0] == 1.0).nonzero(as_tuple=True)[0]
-        inactive_indices = (self.event_command[:, 0] == 0.0).nonzero(as_tuple=True)[0]
+        # Copy base positions and raise them slightly for visualization
+        self._viz_pos.copy_(self.robot.data.root_pos_w)
+        self._viz_pos[:, 2].add_(0.65)
 
-        # Visualize only for active indices
-        if active_indices.numel() > 0:
-            self.command_active_visualizer.visualize(base_pos_w[active_indices])
-        if inactive_indices.numel() > 0:
-            self.command_inactive_visualizer.visualize(base_pos_w[inactive_indices])
+        # Both visualizers draw a marker for every environment: the markers of the other state get a zero scale
+        # note: selecting them with torch.where keeps the shapes fixed, unlike checking and indexing with the masks
+        #   which syncs with the host (the visualizers still copy their inputs to the host, once per update)
+        active_mask = self._active.unsqueeze(1)
+        self.command_active_visualizer.visualize(self._viz_pos, scales=torch.where(active_mask, self._viz_scales, 0.0))
+        self.command_inactive_visualizer.visualize(self._viz_pos, scales=torch.where(active_mask, 0.0, self._viz_scales))
 
 
 GREEN_CUBOID_MARKER_CFG = VisualizationMarkersCfg(
@@ -176,6 +215,9 @@ class EventCommandCfg(CommandTermCfg):
     asset_name : str = MISSING
 
     event_during_time: float = 1.0
+
+    debug_vis_decimation: int = 10
+    """Number of debug visualization callbacks between marker updates. Defaults to 10."""
     
     command_active_visualizer_cfg : VisualizationMarkersCfg = GREEN_CUBOID_MARKER_CFG
     command_inactive_visualizer_cfg : VisualizationMarkersCfg = RED_CUBOID_MARKER_CFG
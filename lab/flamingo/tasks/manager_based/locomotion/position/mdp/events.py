@@ -340,6 +340,187 @@ class randomize_rigid_body_material(ManagerTermBase):
         self.asset.root_physx_view.set_material_properties(materials, env_ids)
 
 
+class randomize_rigid_body_material_fast(randomize_rigid_body_material):
+    """Randomize the physics materials on the geometries of the asset with a single indexed assignment.
+
+    This is equivalent to :class:`randomize_rigid_body_material`, but the shape indices of the selected bodies
+    are resolved once at initialization. Every call then samples the bucket ids of these shapes only and
+    assigns them with one indexed write, instead of looping over the bodies.
+
+    If all the bodies are selected (e.g. ``SceneEntityCfg("robot")`` without ``body_names``), all the shapes
+    of the asset are randomized without parsing the shapes of each body.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The configuration of the event term.
+            env: The environment instance.
+
+        Raises:
+            ValueError: If the asset is not a RigidObject or an Articulation.
+        """
+        super().__init__(cfg, env)
+
+        # resolve the indices of the shapes of the selected bodies
+        if self.num_shapes_per_body is not None:
+            shape_starts = [0]
+            for num_shapes in self.num_shapes_per_body:
+                shape_starts.append(shape_starts[-1] + num_shapes)
+            shape_ids = [
+                shape_id
+                for body_id in self.asset_cfg.body_ids
+                for shape_id in range(shape_starts[body_id], shape_starts[body_id + 1])
+            ]
+            self.shape_ids = torch.tensor(shape_ids, dtype=torch.long, device="cpu")
+        else:
+            self.shape_ids = torch.arange(self.asset.root_physx_view.max_shapes, device="cpu")
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        static_friction_range: tuple[float, float],
+        dynamic_friction_range: tuple[float, float],
+        restitution_range: tuple[float, float],
+        num_buckets: int,
+        asset_cfg: SceneEntityCfg,
+        make_consistent: bool = False,
+    ):
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = torch.arange(env.scene.num_envs, device="cpu")
+        else:
+            env_ids = env_ids.cpu()
+
+        # randomly assign material IDs to the selected geometries
+        bucket_ids = torch.randint(0, num_buckets, (len(env_ids), len(self.shape_ids)), device="cpu")
+
+        # retrieve material buffer from the physics simulation and update it with the new samples
+        materials = self.asset.root_physx_view.get_material_properties()
+        materials[env_ids[:, None], self.shape_ids] = self.material_buckets[bucket_ids]
+
+        # apply to simulation
+        self.asset.root_physx_view.set_material_properties(materials, env_ids)
+
+
+class randomize_actuator_gains_grouped(ManagerTermBase):
+    """Randomize the actuator gains of several joint groups with a single sample per gain.
+
+    This is equivalent to one :func:`isaaclab.envs.mdp.randomize_actuator_gains` term per joint group, but the
+    joints of all the groups are resolved once at initialization. Every call then draws a single random tensor
+    of shape (num_envs, num_joints) per gain, with per-joint distribution bounds, and writes the gains of the
+    implicit actuators into the simulation with a single call.
+
+    Each group is a dictionary with the ``joint_names`` to randomize and the ``stiffness_distribution_params``
+    and/or ``damping_distribution_params`` to sample from. If a group does not provide the parameters for a
+    gain, its joints keep their current value for that gain. The groups are expected not to overlap.
+
+    .. tip::
+        For implicit actuators, this function uses CPU tensors to assign the actuator gains into the simulation.
+        It is recommended to use this function only during the initialization of the environment.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The configuration of the event term.
+            env: The environment instance.
+
+        Raises:
+            ValueError: If the asset is not an Articulation.
+        """
+        super().__init__(cfg, env)
+
+        # extract the used quantities (to enable type-hinting)
+        self.asset_cfg: SceneEntityCfg = cfg.params["asset_cfg"]
+        self.asset: Articulation = env.scene[self.asset_cfg.name]
+
+        if not isinstance(self.asset, Articulation):
+            raise ValueError(
+                f"Randomization term 'randomize_actuator_gains_grouped' not supported for asset: '{self.asset_cfg.name}'"
+                f" with type: '{type(self.asset)}'."
+            )
+
+        # map each joint of the articulation to its actuator and the column inside the actuator
+        joint_to_actuator = {}
+        for actuator in self.asset.actuators.values():
+            if isinstance(actuator.joint_indices, slice):
+                actuator_joint_ids = range(self.asset.num_joints)
+            else:
+                actuator_joint_ids = actuator.joint_indices.tolist()
+            for column, joint_id in enumerate(actuator_joint_ids):
+                joint_to_actuator[joint_id] = (actuator, column)
+
+        # resolve the joints and the per-joint distribution bounds of every gain
+        self.gains = {}
+        for gain in ("stiffness", "damping"):
+            joint_ids, lower, upper = [], [], []
+            for group in cfg.params["groups"]:
+                params = group.get(f"{gain}_distribution_params")
+                if params is None:
+                    continue
+                group_joint_ids, _ = self.asset.find_joints(group["joint_names"], preserve_order=True)
+                joint_ids += group_joint_ids
+                lower += [params[0]] * len(group_joint_ids)
+                upper += [params[1]] * len(group_joint_ids)
+            if len(joint_ids) == 0:
+                continue
+            # columns of the sampled gains that go into each actuator
+            actuator_slots = {}
+            implicit_columns = []
+            for column, joint_id in enumerate(joint_ids):
+                actuator, actuator_column = joint_to_actuator[joint_id]
+                actuator_slots.setdefault(id(actuator), (actuator, [], []))
+                actuator_slots[id(actuator)][1].append(actuator_column)
+                actuator_slots[id(actuator)][2].append(column)
+                if isinstance(actuator, ImplicitActuator):
+                    implicit_columns.append(column)
+            device = self.asset.device
+            joint_ids = torch.tensor(joint_ids, device=device)
+            implicit_columns = torch.tensor(implicit_columns, dtype=torch.long, device=device)
+            self.gains[gain] = (
+                joint_ids,
+                torch.tensor(lower, device=device),
+                torch.tensor(upper, device=device),
+                [
+                    (actuator, torch.tensor(actuator_columns, device=device), torch.tensor(columns, device=device))
+                    for actuator, actuator_columns, columns in actuator_slots.values()
+                ],
+                joint_ids[implicit_columns],
+                implicit_columns,
+            )
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor | None,
+        asset_cfg: SceneEntityCfg,
+        groups: list[dict],
+        operation: Literal["add", "scale", "abs"] = "abs",
+        distribution: Literal["uniform", "log_uniform", "gaussian"] = "uniform",
+    ):
+        # resolve environment ids
+        if env_ids is None:
+            env_ids = torch.arange(env.scene.num_envs, device=self.asset.device)
+
+        for gain, (joint_ids, lower, upper, actuator_slots, implicit_joint_ids, implicit_columns) in self.gains.items():
+            # sample the gains of all the groups at once
+            default_gains = getattr(self.asset.data, f"default_joint_{gain}")
+            gains = default_gains[env_ids[:, None], joint_ids]
+            bounds = (lower.expand_as(gains), upper.expand_as(gains))
+            _randomize_prop_by_op(gains, bounds, None, slice(None), operation, distribution)
+            # set the gains into the actuator models
+            for actuator, actuator_columns, columns in actuator_slots:
+                getattr(actuator, gain)[env_ids[:, None], actuator_columns] = gains[:, columns]
+            # set the gains of the implicit actuators into the physics simulation
+            if len(implicit_columns) > 0:
+                write_to_sim = getattr(self.asset, f"write_joint_{gain}_to_sim")
+                write_to_sim(gains[:, implicit_columns], joint_ids=implicit_joint_ids, env_ids=env_ids)
+
+
 def reset_root_state_uniform(
     env: ManagerBasedEnv,
     env_ids: torch.Tensor,
@@ -385,6 +566,61 @@ def reset_root_state_uniform(
     asset.write_root_com_velocity_to_sim(velocities, env_ids=env_ids)
 
 
+class reset_root_state_uniform_batched(ManagerTermBase):
+    """Reset the asset root state to a random position and velocity uniformly within the given ranges.
+
+    This is equivalent to :func:`reset_root_state_uniform`, but the range tensors are built once at
+    initialization and the pose and velocity offsets are drawn with a single sample of shape (num_envs, 12).
+
+    .. note::
+        The ranges are read from the term parameters at initialization. Changing ``pose_range`` or
+        ``velocity_range`` afterwards (e.g. from a curriculum) has no effect.
+    """
+
+    def __init__(self, cfg: EventTermCfg, env: ManagerBasedEnv):
+        """Initialize the term.
+
+        Args:
+            cfg: The configuration of the event term.
+            env: The environment instance.
+        """
+        super().__init__(cfg, env)
+
+        # extract the used quantities (to enable type-hinting)
+        asset_cfg: SceneEntityCfg = cfg.params.get("asset_cfg", SceneEntityCfg("robot"))
+        self.asset: RigidObject | Articulation = env.scene[asset_cfg.name]
+
+        # ranges of the pose (x, y, z, roll, pitch, yaw) followed by the ones of the velocity
+        keys = ["x", "y", "z", "roll", "pitch", "yaw"]
+        range_list = [cfg.params["pose_range"].get(key, (0.0, 0.0)) for key in keys]
+        range_list += [cfg.params["velocity_range"].get(key, (0.0, 0.0)) for key in keys]
+        ranges = torch.tensor(range_list, device=self.asset.device)
+        self.lower, self.upper = ranges[:, 0], ranges[:, 1]
+
+    def __call__(
+        self,
+        env: ManagerBasedEnv,
+        env_ids: torch.Tensor,
+        pose_range: dict[str, tuple[float, float]],
+        velocity_range: dict[str, tuple[float, float]],
+        asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"),
+    ):
+        # get default root state
+        root_states = self.asset.data.default_root_state[env_ids].clone()
+        rand_samples = math_utils.sample_uniform(self.lower, self.upper, (len(env_ids), 12), device=self.asset.device)
+
+        # poses
+        positions = root_states[:, 0:3] + env.scene.env_origins[env_ids] + rand_samples[:, 0:3]
+        orientations_delta = math_utils.quat_from_euler_xyz(rand_samples[:, 3], rand_samples[:, 4], rand_samples[:, 5])
+        orientations = math_utils.quat_mul(root_states[:, 3:7], orientations_delta)
+        # velocities
+        velocities = root_states[:, 7:13] + rand_samples[:, 6:12]
+
+        # set into the physics simulation
+        self.asset.write_root_link_pose_to_sim(torch.cat([positions, orientations], dim=-1), env_ids=env_ids)
+        self.asset.write_root_com_velocity_to_sim(velocities, env_ids=env_ids)
+
+
 def reset_root_state_with_random_orientation(
     env: ManagerBasedEnv,
     env_ids: torch.Tensor,
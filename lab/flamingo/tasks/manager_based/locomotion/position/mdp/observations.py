@@ -6,7 +6,6 @@
 from __future__ import annotations
 
 import torch
-import math
 from typing import TYPE_CHECKING
 
 import isaaclab.utils.math as math_utils
@@ -14,15 +13,124 @@ from isaaclab.utils.math import wrap_to_pi
 from isaaclab.assets import Articulation, RigidObject
 from isaaclab.managers import SceneEntityCfg
 from isaaclab.sensors import RayCaster
-from isaaclab.utils.math import euler_xyz_from_quat, yaw_quat, quat_rotate, yaw_quat
+from isaaclab.utils.math import euler_xyz_from_quat
 from isaaclab.sensors import ContactSensor
 from isaaclab.markers import VisualizationMarkers
 
+from lab.flamingo.isaaclab.isaaclab.envs.mdp import generated_scaled_commands  # noqa: F401
+from lab.flamingo.isaaclab.isaaclab.envs.mdp.observations import _stack_lift_masks, _wrap, _zero_reward
+
 if TYPE_CHECKING:
     from isaaclab.envs import ManagerBasedEnv, ManagerBasedRLEnv
     
     
-    
+##
+# Compiled tensor kernels.
+# The observation functions read the scene and delegate their elementwise math to these functions, which only
+# take tensors so that torch.compile fuses them into single kernels. The shapes are fixed for a run.
+##
+
+
+@torch.compile(dynamic=False)
+def _wrap_rpy_kernel(roll: torch.Tensor, pitch: torch.Tensor, yaw: torch.Tensor) -> torch.Tensor:
+    """Stacked Euler angles mapped to [-pi, pi], as :func:`_wrap`."""
+    return _wrap(torch.stack((roll, pitch, yaw), dim=-1))
+
+
+@torch.compile(dynamic=False)
+def _world_frame_pose_kernel(root_pos: torch.Tensor, root_quat: torch.Tensor, pos_command_b: torch.Tensor) -> torch.Tensor:
+    """2D position command in the body frame shifted to the world frame, of shape (num_envs, 3)."""
+    # local→world 회전: heading(yaw) 만 사용하는 2D 회전
+    # note: the yaw is computed from the quaternion directly, instead of building the yaw quaternion and rotating
+    #   a zero-padded 3D offset with it. atan2 keeps the rotation finite (identity) when both of its arguments are
+    #   zero, e.g. at a pitch of +-90 degrees or for an all-zero quaternion.
+    qw, qx, qy, qz = root_quat.unbind(dim=-1)
+    yaw = torch.atan2(2.0 * (qw * qz + qx * qy), 1.0 - 2.0 * (qy * qy + qz * qz))
+    sin_yaw, cos_yaw = torch.sin(yaw), torch.cos(yaw)
+    cmd_x, cmd_y = pos_command_b.unbind(dim=-1)
+    # translation 보정 (the offset has no z component)
+    offset_w = torch.stack((cos_yaw * cmd_x - sin_yaw * cmd_y, sin_yaw * cmd_x + cos_yaw * cmd_y), dim=-1)
+    return torch.cat((root_pos[:, :2] + offset_w, root_pos[:, 2:]), dim=-1)
+
+
+def _entity_cache(env: ManagerBasedEnv, cfg: SceneEntityCfg) -> dict:
+    """Values derived from the entity configuration (ids, entities, ...), computed once per environment.
+
+    The values are stored on the environment and not on the configuration, since the configurations passed
+    to the terms are often the default arguments of the functions, which are shared by all the environments
+    of the process. The configuration is kept with its values so that its id is not reused.
+    """
+    caches = env.__dict__.setdefault("_entity_caches", dict())
+    entry = caches.get(id(cfg))
+    if entry is None or entry[0] is not cfg:
+        entry = (cfg, dict())
+        caches[id(cfg)] = entry
+    return entry[1]
+
+
+def _body_ids_t(env: ManagerBasedEnv, cfg: SceneEntityCfg) -> torch.Tensor | slice:
+    """Body ids of the entity as a device tensor, cached on the environment.
+
+    Indexing with a list of ids converts it into a tensor (and copies it to the device) on every call.
+    The resolved ids are thus converted once. If all the bodies are selected, the slice is returned as is.
+    If the ids are consecutive (e.g. a left/right pair), they are converted into a slice, so that indexing
+    returns a view instead of gathering the bodies.
+    """
+    return _cached_ids_t(env, cfg, "body_ids")
+
+
+def _joint_ids_t(env: ManagerBasedEnv, cfg: SceneEntityCfg) -> torch.Tensor | slice:
+    """Joint ids of the entity as a device tensor, cached on the environment.
+
+    See :func:`_body_ids_t`.
+    """
+    return _cached_ids_t(env, cfg, "joint_ids")
+
+
+def _cached_ids_t(env: ManagerBasedEnv, cfg: SceneEntityCfg, name: str) -> torch.Tensor | slice:
+    cache = _entity_cache(env, cfg)
+    ids = cache.get(name)
+    if ids is None:
+        ids = getattr(cfg, name)
+        if not isinstance(ids, slice):
+            ids = list(ids)
+            if len(ids) > 0 and ids == list(range(ids[0], ids[0] + len(ids))):
+                ids = slice(ids[0], ids[0] + len(ids))
+            else:
+                ids = torch.as_tensor(ids, dtype=torch.long, device=env.device)
+        cache[name] = ids
+    return ids
+
+
+def _default_joint_pos_t(env: ManagerBasedEnv, cfg: SceneEntityCfg) -> torch.Tensor:
+    """Default positions of the joints of the entity, gathered once and cached on the environment.
+
+    Note:
+        The default joint positions are only written when the asset is created, so the gathered copy does not
+        go stale. Events that modify :attr:`default_joint_pos` have to drop the cached copy.
+    """
+    cache = _entity_cache(env, cfg)
+    default_joint_pos = cache.get("default_joint_pos")
+    if default_joint_pos is None:
+        asset: Articulation = _scene_entity(env, cfg)
+        default_joint_pos = asset.data.default_joint_pos[:, _joint_ids_t(env, cfg)].clone()
+        cache["default_joint_pos"] = default_joint_pos
+    return default_joint_pos
+
+
+def _scene_entity(env: ManagerBasedEnv, cfg: SceneEntityCfg):
+    """Asset or sensor of the entity in the scene, cached on the environment.
+
+    Looking up the entity in the scene goes through the dictionaries of all the entity types on every call.
+    The entity is thus looked up once per environment.
+    """
+    cache = _entity_cache(env, cfg)
+    entity = cache.get("entity")
+    if entity is None:
+        entity = env.scene[cfg.name]
+        cache["entity"] = entity
+    return entity
+
 
 def feet_height_scan(env: ManagerBasedEnv, sensor_cfg: SceneEntityCfg, offset: float = 0.5, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Height scan from the given sensor w.r.t. the sensor's frame.
@@ -41,98 +149,108 @@ def feet_height_scan(env: ManagerBasedEnv, sensor_cfg: SceneEntityCfg, offset: f
 def base_lin_vel_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Root linear velocity in the asset's root frame."""
     # extract the used quantities (to enable type-hinting)
-    asset: RigidObject = env.scene[asset_cfg.name]
+    asset: RigidObject = _scene_entity(env, asset_cfg)
     return asset.data.root_link_lin_vel_b
 
 def base_lin_vel_x_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Root linear velocity in the asset's root frame."""
     # extract the used quantities (to enable type-hinting)
-    asset: RigidObject = env.scene[asset_cfg.name]
+    asset: RigidObject = _scene_entity(env, asset_cfg)
     return asset.data.root_link_lin_vel_b[:, 0].unsqueeze(-1)
 
 def base_lin_vel_y_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Root linear velocity in the asset's root frame."""
     # extract the used quantities (to enable type-hinting)
-    asset: RigidObject = env.scene[asset_cfg.name]
+    asset: RigidObject = _scene_entity(env, asset_cfg)
     return asset.data.root_link_lin_vel_b[:, 1].unsqueeze(-1)
 
 def base_lin_vel_z_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Root linear velocity in the asset's root frame."""
     # extract the used quantities (to enable type-hinting)
-    asset: RigidObject = env.scene[asset_cfg.name]
-    return asset.data.root_link_lin_vel_b[:, 1].unsqueeze(-1)
+    asset: RigidObject = _scene_entity(env, asset_cfg)
+    return asset.data.root_link_lin_vel_b[:, 2].unsqueeze(-1)
 
 def base_ang_vel_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Root angular velocity in the asset's root frame."""
     # extract the used quantities (to enable type-hinting)
-    asset: RigidObject = env.scene[asset_cfg.name]
+    asset: RigidObject = _scene_entity(env, asset_cfg)
     return asset.data.root_link_ang_vel_b
 
         
 def base_pos_z_rel_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"), sensor_cfg: SceneEntityCfg | None = None) -> torch.Tensor:
     """Root height in the simulation world frame."""
     # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
+    asset: Articulation = _scene_entity(env, asset_cfg)
     if sensor_cfg is not None:
-        sensor: RayCaster = env.scene[sensor_cfg.name]
-        return asset.data.root_link_pos_w[:, 2].unsqueeze(-1) - sensor.data.ray_hits_w[..., 2]
-    else:
-        return asset.data.root_link_pos_w[:, 2].unsqueeze(-1)
-    
-def base_pos_z_rel(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot"), sensor_cfg: SceneEntityCfg | None = None) -> torch.Tensor:
-    """Root height in the simulation world frame."""
-    # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    if sensor_cfg is not None:
-        sensor: RayCaster = env.scene[sensor_cfg.name]
+        sensor: RayCaster = _scene_entity(env, sensor_cfg)
         return asset.data.root_link_pos_w[:, 2].unsqueeze(-1) - sensor.data.ray_hits_w[..., 2]
     else:
         return asset.data.root_link_pos_w[:, 2].unsqueeze(-1)
 
 
+# both terms read the root link position, thus they share the same implementation
+base_pos_z_rel = base_pos_z_rel_link
+
+
 def current_reward(env: ManagerBasedRLEnv) -> torch.Tensor:
     """The current reward value. Returns zeros if the reward manager is not initialized."""
     if not hasattr(env, "reward_manager") or env.reward_manager is None:
         # Assuming the shape should be (num_envs,) based on the environment
-        return torch.zeros((env.num_envs, 1), dtype=torch.float32, device=env.device)
+        return _zero_reward(env)
 
     try:
         return env.reward_buf.unsqueeze(-1)
     except AttributeError:
         # Fallback to zeros if the reward_manager is initialized but compute isn't ready
-        return torch.zeros((env.num_envs, 1), dtype=torch.float32, device=env.device)
+        return _zero_reward(env)
 
 
 def joint_torques(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    return asset.data.applied_torque[:, asset_cfg.joint_ids]
+    asset: Articulation = _scene_entity(env, asset_cfg)
+    return asset.data.applied_torque[:, _joint_ids_t(env, asset_cfg)]
 
 
 def is_contact(env: ManagerBasedRLEnv, threshold: float, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
     # extract the used quantities (to enable type-hinting)
-    contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
+    contact_sensor: ContactSensor = _scene_entity(env, sensor_cfg)
     # check if contact force is above threshold
+    # note: the squared norms are compared against the squared threshold to avoid the square root
     net_contact_forces = contact_sensor.data.net_forces_w_history
-    is_contact = torch.max(torch.norm(net_contact_forces[:, :, sensor_cfg.body_ids], dim=-1), dim=1)[0] > threshold
+    force_sq = net_contact_forces[:, :, _body_ids_t(env, sensor_cfg)].square().sum(dim=-1)
+    is_contact = force_sq.amax(dim=1) > threshold * threshold
     return is_contact.float()
 
 def measure_contact_forces(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Contact forces of the given bodies (e.g. the left and right wheels), flattened to (num_envs, 3 * num_bodies)."""
     # extract the used quantities (to enable type-hinting)
-    contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
-    # check if contact force is above threshold
-    left_contact_forces = contact_sensor.data.net_forces_w[:, sensor_cfg.body_ids[0]]
-    right_contact_forces = contact_sensor.data.net_forces_w[:, sensor_cfg.body_ids[1]]
-    return torch.concat([left_contact_forces,right_contact_forces],dim=1)
+    contact_sensor: ContactSensor = _scene_entity(env, sensor_cfg)
+    # index the forces of all the bodies at once (a view if the bodies are consecutive)
+    contact_forces = contact_sensor.data.net_forces_w[:, _body_ids_t(env, sensor_cfg)]
+    return contact_forces.reshape(contact_forces.shape[0], -1)
 
 def measure_feet_air_time(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
     # extract the used quantities (to enable type-hinting)
-    contact_sensor: ContactSensor = env.scene.sensors[sensor_cfg.name]
+    contact_sensor: ContactSensor = _scene_entity(env, sensor_cfg)
     # check if contact force is above threshold
-    air_time = contact_sensor.data.current_air_time[:, sensor_cfg.body_ids]
+    air_time = contact_sensor.data.current_air_time[:, _body_ids_t(env, sensor_cfg)]
     #contact_time = contact_sensor.data.current_contact_time[:, sensor_cfg.body_ids]
     return air_time
 
+def wheel_contact_features(env: ManagerBasedRLEnv, sensor_cfg: SceneEntityCfg) -> torch.Tensor:
+    """Contact forces and air time of the given bodies.
+
+    Equivalent to concatenating :func:`measure_contact_forces` and :func:`measure_feet_air_time`, with a single
+    read of the contact sensor data.
+    """
+    # extract the used quantities (to enable type-hinting)
+    contact_sensor: ContactSensor = _scene_entity(env, sensor_cfg)
+    data = contact_sensor.data
+    body_ids = _body_ids_t(env, sensor_cfg)
+    contact_forces = data.net_forces_w[:, body_ids].reshape(env.num_envs, -1)
+    air_time = data.current_air_time[:, body_ids]
+    return torch.cat([contact_forces, air_time], dim=-1)
+
 
 def lift_mask_by_height_scan(
     env: ManagerBasedRLEnv,
@@ -154,13 +272,14 @@ def lift_mask_by_height_scan(
         torch.Tensor: Lift mask for left and right legs. Shape: [num_envs, 2].
     """
     #* Step 1: Extract ray hit positions (Z coordinates) from left and right sensors
-    left_lift_mask_sensor = env.scene.sensors[sensor_cfg_left.name]
-    right_lift_mask_sensor = env.scene.sensors[sensor_cfg_right.name]
+    left_lift_mask_sensor = _scene_entity(env, sensor_cfg_left)
+    right_lift_mask_sensor = _scene_entity(env, sensor_cfg_right)
 
     left_mask= left_lift_mask_sensor.data.mask 
     right_mask = right_lift_mask_sensor.data.mask  
     
-    lift_mask = torch.stack([left_mask, right_mask], dim=1) 
+    # stack the masks into a buffer owned by the env
+    lift_mask = _stack_lift_masks(env, (sensor_cfg_left.name, sensor_cfg_right.name), left_mask, right_mask)
 
     # command_norm = torch.norm(env.command_manager.get_command(command_name)[:, :3], dim=1)  # Shape: [num_envs]
     # lift_mask *= (command_norm > 0.1).unsqueeze(-1).float()  # Apply movement condition
@@ -173,36 +292,28 @@ def joint_acc(env: ManagerBasedRLEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg
     NOTE: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their joint accelerations contribute to the term.
     """
     # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    return asset.data.joint_acc[:, asset_cfg.joint_ids]
+    asset: Articulation = _scene_entity(env, asset_cfg)
+    return asset.data.joint_acc[:, _joint_ids_t(env, asset_cfg)]
 
 
 def base_euler_angle(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Asset root orientation in the environment frame as Euler angles (roll, pitch, yaw)."""
     # extract the used quantities (to enable type-hinting)
-    asset = env.scene[asset_cfg.name]
+    asset = _scene_entity(env, asset_cfg)
     roll, pitch, yaw = euler_xyz_from_quat(asset.data.root_com_quat_w)
 
-    # Map angles from [0, 2*pi] to [-pi, pi]
-    roll = (roll + math.pi) % (2 * math.pi) - math.pi
-    pitch = (pitch + math.pi) % (2 * math.pi) - math.pi
-    yaw = (yaw + math.pi) % (2 * math.pi) - math.pi
-
-    rpy = torch.stack((roll, pitch, yaw), dim=-1)
+    # Map angles from [0, 2*pi] to [-pi, pi] (in one pass over the stacked angles)
+    rpy = _wrap_rpy_kernel(roll, pitch, yaw)
     return rpy
 
 def base_euler_angle_link(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """Asset root orientation in the environment frame as Euler angles (roll, pitch, yaw)."""
     # extract the used quantities (to enable type-hinting)
-    asset = env.scene[asset_cfg.name]
+    asset = _scene_entity(env, asset_cfg)
     roll, pitch, yaw = euler_xyz_from_quat(asset.data.root_link_quat_w)
 
-    # Map angles from [0, 2*pi] to [-pi, pi]
-    roll = (roll + math.pi) % (2 * math.pi) - math.pi
-    pitch = (pitch + math.pi) % (2 * math.pi) - math.pi
-    yaw = (yaw + math.pi) % (2 * math.pi) - math.pi
-
-    rpy = torch.stack((roll, pitch, yaw), dim=-1)
+    # Map angles from [0, 2*pi] to [-pi, pi] (in one pass over the stacked angles)
+    rpy = _wrap_rpy_kernel(roll, pitch, yaw)
     return rpy
 
 
@@ -212,9 +323,10 @@ def joint_pos_rel_sin(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEnt
     NOTE: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their positions returned.
     """
     # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    current_value = asset.data.joint_pos[:, asset_cfg.joint_ids] - asset.data.default_joint_pos[:, asset_cfg.joint_ids]
-    current_value_sin = torch.sin(current_value)
+    asset: Articulation = _scene_entity(env, asset_cfg)
+    current_value_sin = torch.sin(
+        asset.data.joint_pos[:, _joint_ids_t(env, asset_cfg)] - _default_joint_pos_t(env, asset_cfg)
+    )
     return current_value_sin
 
 
@@ -224,9 +336,10 @@ def joint_pos_rel_cos(env: ManagerBasedEnv, asset_cfg: SceneEntityCfg = SceneEnt
     NOTE: Only the joints configured in :attr:`asset_cfg.joint_ids` will have their positions returned.
     """
     # extract the used quantities (to enable type-hinting)
-    asset: Articulation = env.scene[asset_cfg.name]
-    current_value = asset.data.joint_pos[:, asset_cfg.joint_ids] - asset.data.default_joint_pos[:, asset_cfg.joint_ids]
-    current_value_cos = torch.cos(current_value)
+    asset: Articulation = _scene_entity(env, asset_cfg)
+    current_value_cos = torch.cos(
+        asset.data.joint_pos[:, _joint_ids_t(env, asset_cfg)] - _default_joint_pos_t(env, asset_cfg)
+    )
     return current_value_cos
 
 
@@ -236,7 +349,7 @@ def height_scan_raw(env: ManagerBasedEnv, sensor_cfg: SceneEntityCfg) -> torch.T
     The provided offset (Defaults to 0.5) is subtracted from the returned values.
     """
     # extract the used quantities (to enable type-hinting)
-    sensor: RayCaster = env.scene.sensors[sensor_cfg.name]
+    sensor: RayCaster = _scene_entity(env, sensor_cfg)
     # height scan: height = sensor_height - hit_point_z - offset
     return sensor.data.ray_hits_w[..., 2]
 
@@ -246,33 +359,19 @@ def generated_partial_commands(env: ManagerBasedRLEnv, command_name: str) -> tor
     return env.command_manager.get_command(command_name)[:, 0]
 
 
-def generated_scaled_commands(env: ManagerBasedRLEnv, command_name: str, scale: tuple) -> torch.Tensor:
-    """The generated command from command term in the command manager with the given name."""
-    scaled_command = env.command_manager.get_command(command_name).clone()
-    scaled_command[:, :3] *= torch.tensor(scale, device=env.device)
-    return scaled_command
-
 def generated_world_frame_pose_commands(env: ManagerBasedRLEnv, command_name: str = "pose_command", asset_cfg: SceneEntityCfg = SceneEntityCfg("robot")) -> torch.Tensor:
     """The generated command from command term in the command manager with the given name."""
-    asset: Articulation = env.scene[asset_cfg.name]
+    asset: Articulation = _scene_entity(env, asset_cfg)
     
     # 1) 로봇 현위치(월드)와 회전(월드 쿼터니언)
     root_pos  = asset.data.root_pos_w        # (N, 3)
     root_quat = asset.data.root_quat_w       # (N, 4) in (w, x, y, z)
 
-    # 2) body‐frame 에서 넘어온 2D 목표 오프셋
-    pos_command_b2 = env.command_manager.get_command(command_name)  # (N, 2)
-
-    # 3) Z 성분을 0 으로 패딩해서 3D 벡터로 만들기
-    zeros_z    = torch.zeros(pos_command_b2.shape[0], 1, device=pos_command_b2.device)
-    pos_command_b = torch.cat((pos_command_b2, zeros_z), dim=1)      # (N, 3)
-
-    # 4) local→world 회전: yaw 쿼터니언(heading)만 뽑아서 forward rotate
-    yaw_q       = yaw_quat(root_quat)                                # (N, 4)
-    world_offset = quat_rotate(yaw_q, pos_command_b)                # (N, 3)
+    # 2) body‐frame 에서 넘어온 2D 목표 오프셋 (x, y)
+    pos_command_b2 = env.command_manager.get_command(command_name)[:, :2]  # (N, 2)
 
-    # 5) translation 보정
-    pos_command_w = root_pos + world_offset                         # (N, 3)
+    # 3) local→world 회전 + 4) translation 보정
+    pos_command_w = _world_frame_pose_kernel(root_pos, root_quat, pos_command_b2)  # (N, 3)
     
     return pos_command_w#[:,:2]
     
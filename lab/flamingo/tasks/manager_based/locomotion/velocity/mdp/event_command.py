@@ -103,14 +103,13 @@ class EventCommand(CommandTerm):
         self.event_command[:, 0] = torch.logical_and(self.event_command[:,0]==1.0 , self.time_elapsed <= self.event_during_time).float()
         self.event_command[:,1] = self.time_elapsed
 
-        reset_env_ids = self._env.reset_buf.nonzero(as_tuple=False).flatten()
-        if len(reset_env_ids) > 0:
-            self.time_elapsed[reset_env_ids] = 0.0
-            self.event_command[reset_env_ids] = 0.0
+        # clear the reset environments with masked writes (no index gathering and host sync)
+        reset_mask = self._env.reset_buf.bool()
+        self.time_elapsed.masked_fill_(reset_mask, 0.0)
+        self.event_command.masked_fill_(reset_mask.unsqueeze(1), 0.0)
 
         # Enforce standing for standing environments
-        standing_env_ids = self.is_standing_env.nonzero(as_tuple=False).flatten()
-        self.event_command[standing_env_ids] = 0.0
+        self.event_command.masked_fill_(self.is_standing_env.unsqueeze(1), 0.0)
 
     def _set_debug_vis_impl(self, debug_vis: bool):
             if debug_vis:
@@ -21,6 +21,8 @@ class ActorCritic(nn.Module):
         critic_hidden_dims=[256, 256, 256],
         activation="elu",
         init_noise_std=1.0,
+        policy_dtype="float32",
+        compile_policy=False,
         **kwargs,
     ):
         if kwargs:
@@ -60,6 +62,20 @@ class ActorCritic(nn.Module):
         print(f"Actor MLP: {self.actor}")
         print(f"Critic MLP: {self.critic}")
 
+        # Precision of the actor forward pass: the parameters stay in float32 and act as the master weights,
+        # the actor runs under autocast and its output is cast back to float32
+        # note: the critic always runs in float32 to keep the precision of the value regression
+        self.policy_dtype = getattr(torch, policy_dtype)
+        self.use_autocast = self.policy_dtype != torch.float32
+
+        # Compile the forward passes (the networks themselves stay eager so that they can still be exported)
+        # note: the default mode is used since the same forward passes run in the rollout and, with autograd and the
+        #   mini-batch shape, in the update. The CUDA graphs of "reduce-overhead" would overwrite their static outputs
+        #   (e.g. the tensors stored in the rollout storage or saved for the backward pass) on the next replay.
+        if compile_policy:
+            self._actor_forward = torch.compile(self._actor_forward)
+            self._critic_forward = torch.compile(self._critic_forward)
+
         # Action noise
         self.std = nn.Parameter(init_noise_std * torch.ones(num_actions))
         self.distribution = None
@@ -96,8 +112,15 @@ class ActorCritic(nn.Module):
     def entropy(self):
         return self.distribution.entropy().sum(dim=-1)
 
+    def _actor_forward(self, observations):
+        with torch.autocast(observations.device.type, dtype=self.policy_dtype, enabled=self.use_autocast):
+            return self.actor(observations).float()
+
+    def _critic_forward(self, critic_observations):
+        return self.critic(critic_observations)
+
     def update_distribution(self, observations):
-        mean = self.actor(observations)
+        mean = self._actor_forward(observations)
         self.distribution = Normal(mean, mean * 0.0 + self.std)
 
     def act(self, observations, **kwargs):
@@ -108,11 +131,11 @@ class ActorCritic(nn.Module):
         return self.distribution.log_prob(actions).sum(dim=-1)
 
     def act_inference(self, observations):
-        actions_mean = self.actor(observations)
+        actions_mean = self._actor_forward(observations)
         return actions_mean
 
     def evaluate(self, critic_observations, **kwargs):
-        value = self.critic(critic_observations)
+        value = self._critic_forward(critic_observations)
         return value
 
 
@@ -25,6 +25,8 @@ class ActorCriticRecurrent(ActorCritic):
         rnn_hidden_size=256,
         rnn_num_layers=1,
         init_noise_std=1.0,
+        policy_dtype="float32",
+        compile_policy=False,
         **kwargs,
     ):
         if kwargs:
@@ -40,6 +42,8 @@ class ActorCriticRecurrent(ActorCritic):
             critic_hidden_dims=critic_hidden_dims,
             activation=activation,
             init_noise_std=init_noise_std,
+            policy_dtype=policy_dtype,
+            compile_policy=compile_policy,
         )
 
         activation = resolve_nn_activation(activation)
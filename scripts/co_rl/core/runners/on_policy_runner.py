@@ -136,6 +136,8 @@ class OnPolicyRunner:
         for it in range(start_iter, tot_iter):
             start = time.time()
             # Rollout
+            # note: the loop itself stays eager since env.step drives PhysX and the managers, which cannot be
+            #   traced. The per-step policy cost is reduced through the actor-critic (see `compile_policy`).
             with torch.inference_mode():
                 for i in range(self.num_steps_per_env):
                     actions = self.alg.act(obs, critic_obs)
@@ -46,6 +46,20 @@ class CoRlPpoActorCriticCfg:
     activation: str = MISSING
     """The activation function for the actor and critic networks."""
 
+    policy_dtype: Literal["float32", "bfloat16"] = "float32"
+    """The precision of the actor forward pass. Default is float32.
+
+    With bfloat16, the actor runs under autocast while the parameters (and the optimizer) stay in float32.
+    The critic always runs in float32.
+    """
+
+    compile_policy: bool = False
+    """Whether to compile the actor and critic forward passes with :func:`torch.compile`. Default is False.
+
+    The forward passes are compiled in the default mode, without CUDA graphs, since they are shared by the rollout
+    and the update. The batch size of the update triggers one recompilation with dynamic shapes.
+    """
+
 
 @configclass
 class CoRlPpoAlgorithmCfg: